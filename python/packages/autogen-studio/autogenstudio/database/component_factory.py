@@ -86,6 +86,14 @@ class ComponentFactory:
         ComponentTypes.TERMINATION: ["1.0.0"],
     }
 
+    CONFIG_TYPES = {
+        ComponentTypes.TEAM: TeamConfig,
+        ComponentTypes.AGENT: AgentConfig,
+        ComponentTypes.MODEL: ModelConfig,
+        ComponentTypes.TOOL: ToolConfig,
+        ComponentTypes.TERMINATION: TerminationConfig,
+    }
+
     def __init__(self):
         self._model_cache: Dict[str, OpenAIChatCompletionClient] = {}
         self._tool_cache: Dict[str, FunctionTool] = {}
@@ -176,16 +184,8 @@ def _dict_to_config(self, config_dict: dict) -> ComponentConfig:
         if "component_type" not in config_dict:
             raise ValueError("component_type is required in configuration")
 
-        config_types = {
-            ComponentTypes.TEAM: TeamConfig,
-            ComponentTypes.AGENT: AgentConfig,
-            ComponentTypes.MODEL: ModelConfig,
-            ComponentTypes.TOOL: ToolConfig,
-            ComponentTypes.TERMINATION: TerminationConfig,  # Add mapping for termination
-        }
-
         component_type = ComponentTypes(config_dict["component_type"])
-        config_class = config_types.get(component_type)
+        config_class = self.CONFIG_TYPES.get(component_type)
 
         if not config_class:
             raise ValueError(f"Unknown component type: {component_type}")
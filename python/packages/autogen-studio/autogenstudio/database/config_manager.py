@@ -1,4 +1,5 @@
 import logging
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -20,6 +21,13 @@ class ConfigurationManager:
         ComponentTypes.TEAM: ["team_type", "name"],
     }
 
+    COMPONENT_CLASSES = {
+        ComponentTypes.MODEL: Model,
+        ComponentTypes.TOOL: Tool,
+        ComponentTypes.AGENT: Agent,
+        ComponentTypes.TEAM: Team,
+    }
+
     def __init__(self, db_manager: DatabaseManager, uniqueness_fields: Dict[ComponentTypes, List[str]] = None):
         self.db_manager = db_manager
         self.component_factory = ComponentFactory()
@@ -42,7 +50,15 @@ async def import_component(
         try:
             # Get validated config as dict
             config = await self.component_factory.load(component_config, return_type="dict")
+            return await self._import_config(config, user_id, check_exists)
 
+        except Exception as e:
+            logger.error(f"Failed to import component: {str(e)}")
+            return Response(message=str(e), status=False)
+
+    async def _import_config(self, config: dict, user_id: str, check_exists: bool = False) -> Response:
+        """Store an already validated component config dict"""
+        try:
             # Get component type
             component_type = self._determine_component_type(config)
             if not component_type:
@@ -60,9 +76,9 @@ async def import_component(
 
             # Route to appropriate storage method
             if component_type == ComponentTypes.TEAM:
-                return await self._store_team(config, user_id, check_exists)
+                return await self._store_team(config, user_id, check_exists, lookup_cache={})
             elif component_type == ComponentTypes.AGENT:
-                return await self._store_agent(config, user_id, check_exists)
+                return await self._store_agent(config, user_id, check_exists, lookup_cache={})
             elif component_type == ComponentTypes.MODEL:
                 return await self._store_model(config, user_id)
             elif component_type == ComponentTypes.TOOL:
@@ -91,7 +107,8 @@ async def import_directory(self, directory: Union[str, Path], user_id: str, chec
 
             results = []
             for config in configs:
-                result = await self.import_component(config, user_id, check_exists)
+                # Configs are already validated by load_directory, so skip import_component's re-validation
+                result = await self._import_config(config, user_id, check_exists)
                 results.append(
                     {
                         "component": self._get_component_type(config),
@@ -107,95 +124,111 @@ async def import_directory(self, directory: Union[str, Path], user_id: str, chec
             logger.error(f"Failed to import directory: {str(e)}")
             return Response(message=str(e), status=False)
 
-    async def _store_team(self, config: dict, user_id: str, check_exists: bool = False) -> Response:
-        """Store team component and manage its relationships with agents"""
+    async def _store_team(
+        self, config: dict, user_id: str, check_exists: bool = False, lookup_cache: Optional[dict] = None
+    ) -> Response:
+        """Store team component and its agents, models, tools and links in a single transaction"""
         try:
-            # Store the team
+            lookup_cache = {} if lookup_cache is None else lookup_cache
+
             team_db = Team(user_id=user_id, config=config)
-            team_result = self.db_manager.upsert(team_db)
-            if not team_result.status:
-                return team_result
+            new_entities = [team_db]
+            links = []
 
-            team_id = team_result.data["id"]
+            # Handle participants (agents). Each team gets its own agent rows: TeamAgentLink is unique on
+            # (agent_id, sequence), so a stored agent cannot be linked into a second team. Models and tools
+            # are still reused.
+            agent_dbs = [
+                self._collect_agent(participant, user_id, check_exists, lookup_cache, new_entities, links)
+                for participant in config.get("participants", [])
+            ]
 
-            # Handle participants (agents)
-            for participant in config.get("participants", []):
-                if check_exists:
-                    # Check for existing agent
-                    agent_type = self._determine_component_type(participant)
-                    existing_agent = self._check_exists(agent_type, participant, user_id)
-                    if existing_agent:
-                        # Link existing agent
-                        self.db_manager.link(LinkTypes.TEAM_AGENT, team_id, existing_agent.id)
-                        logger.info(f"Linked existing agent to team: {existing_agent}")
-                        continue
-
-                # Store and link new agent
-                agent_result = await self._store_agent(participant, user_id, check_exists)
-                if agent_result.status:
-                    self.db_manager.link(LinkTypes.TEAM_AGENT, team_id, agent_result.data["id"])
-
-            return team_result
+            if agent_dbs:
+                links.append((LinkTypes.TEAM_AGENT, team_db, agent_dbs))
+
+            created = self.db_manager.add_all(new_entities, links)
+            if not created.status:
+                return created
+
+            return Response(message="Team Created Successfully", status=True, data=created.data[0])
 
         except Exception as e:
             logger.error(f"Failed to store team: {str(e)}")
             return Response(message=str(e), status=False)
 
-    async def _store_agent(self, config: dict, user_id: str, check_exists: bool = False) -> Response:
-        """Store agent component and manage its relationships with tools and model"""
+    async def _store_agent(
+        self, config: dict, user_id: str, check_exists: bool = False, lookup_cache: Optional[dict] = None
+    ) -> Response:
+        """Store agent component and its model, tools and links in a single transaction"""
         try:
-            # Store the agent
-            agent_db = Agent(user_id=user_id, config=config)
-            agent_result = self.db_manager.upsert(agent_db)
-            if not agent_result.status:
-                return agent_result
+            lookup_cache = {} if lookup_cache is None else lookup_cache
 
-            agent_id = agent_result.data["id"]
+            new_entities = []
+            links = []
+            self._collect_agent(config, user_id, check_exists, lookup_cache, new_entities, links)
 
-            # Handle model client
-            if "model_client" in config:
-                if check_exists:
-                    # Check for existing model
-                    model_type = self._determine_component_type(config["model_client"])
-                    existing_model = self._check_exists(model_type, config["model_client"], user_id)
-                    if existing_model:
-                        # Link existing model
-                        self.db_manager.link(LinkTypes.AGENT_MODEL, agent_id, existing_model.id)
-                        logger.info(f"Linked existing model to agent: {existing_model.config.model_type}")
-                    else:
-                        # Store and link new model
-                        model_result = await self._store_model(config["model_client"], user_id)
-                        if model_result.status:
-                            self.db_manager.link(LinkTypes.AGENT_MODEL, agent_id, model_result.data["id"])
-                else:
-                    # Store and link new model without checking
-                    model_result = await self._store_model(config["model_client"], user_id)
-                    if model_result.status:
-                        self.db_manager.link(LinkTypes.AGENT_MODEL, agent_id, model_result.data["id"])
-
-            # Handle tools
-            for tool_config in config.get("tools", []):
-                if check_exists:
-                    # Check for existing tool
-                    tool_type = self._determine_component_type(tool_config)
-                    existing_tool = self._check_exists(tool_type, tool_config, user_id)
-                    if existing_tool:
-                        # Link existing tool
-                        self.db_manager.link(LinkTypes.AGENT_TOOL, agent_id, existing_tool.id)
-                        logger.info(f"Linked existing tool to agent: {existing_tool.config.name}")
-                        continue
-
-                # Store and link new tool
-                tool_result = await self._store_tool(tool_config, user_id)
-                if tool_result.status:
-                    self.db_manager.link(LinkTypes.AGENT_TOOL, agent_id, tool_result.data["id"])
-
-            return agent_result
+            created = self.db_manager.add_all(new_entities, links)
+            if not created.status:
+                return created
+
+            return Response(message="Agent Created Successfully", status=True, data=created.data[0])
 
         except Exception as e:
             logger.error(f"Failed to store agent: {str(e)}")
             return Response(message=str(e), status=False)
 
+    def _collect_agent(
+        self,
+        config: dict,
+        user_id: str,
+        check_exists: bool,
+        lookup_cache: dict,
+        new_entities: List[Union[Agent, Model, Tool]],
+        links: list,
+    ) -> Agent:
+        """Build a new agent with its model and tools, appending new entities and links to be written together"""
+        agent_db = Agent(user_id=user_id, config=config)
+        new_entities.append(agent_db)
+
+        # Handle model client
+        model_db = None
+        if config.get("model_client"):
+            if check_exists:
+                # Check for existing model
+                model_type = self._determine_component_type(config["model_client"])
+                model_db = self._check_exists_cached(model_type, config["model_client"], user_id, lookup_cache)
+                # Components created earlier in this import have no id yet, only log rows already stored
+                if model_db and model_db.id is not None:
+                    logger.info(f"Linked existing model to agent: {model_db.config['model_type']}")
+            if not model_db:
+                model_db = Model(user_id=user_id, config=config["model_client"])
+                new_entities.append(model_db)
+                if check_exists:
+                    # Remember it so agents later in this import reuse it
+                    self._remember(lookup_cache, ComponentTypes.MODEL, model_db.config, model_db)
+            links.append((LinkTypes.AGENT_MODEL, agent_db, [model_db]))
+
+        # Handle tools
+        tool_dbs = []
+        for tool_config in config.get("tools") or []:
+            tool_db = None
+            if check_exists:
+                # Check for existing tool
+                tool_type = self._determine_component_type(tool_config)
+                tool_db = self._check_exists_cached(tool_type, tool_config, user_id, lookup_cache)
+                if tool_db and tool_db.id is not None:
+                    logger.info(f"Linked existing tool to agent: {tool_db.config['name']}")
+            if not tool_db:
+                tool_db = Tool(user_id=user_id, config=tool_config)
+                new_entities.append(tool_db)
+                if check_exists:
+                    self._remember(lookup_cache, ComponentTypes.TOOL, tool_db.config, tool_db)
+            tool_dbs.append(tool_db)
+        if tool_dbs:
+            links.append((LinkTypes.AGENT_TOOL, agent_db, tool_dbs))
+
+        return agent_db
+
     async def _store_model(self, config: dict, user_id: str) -> Response:
         """Store model component (leaf node - no relationships)"""
         try:
@@ -224,14 +257,18 @@ def _check_exists(
         if not fields:
             return None
 
-        component_class = {
-            ComponentTypes.MODEL: Model,
-            ComponentTypes.TOOL: Tool,
-            ComponentTypes.AGENT: Agent,
-            ComponentTypes.TEAM: Team,
-        }.get(component_type)
+        component_class = self.COMPONENT_CLASSES.get(component_type)
+
+        # Narrow candidates in SQL; fields the JSON filter cannot express are checked below
+        config_filters = {}
+        for field in fields:
+            value = config.get(field)
+            if isinstance(value, Enum):
+                value = value.value
+            if value is None or isinstance(value, str):
+                config_filters[field] = value
 
-        components = self.db_manager.get(component_class, {"user_id": user_id}).data
+        components = self.db_manager.get(component_class, {"user_id": user_id}, config_filters=config_filters).data
 
         for component in components:
             matches = all(component.config.get(field) == config.get(field) for field in fields)
@@ -240,6 +277,26 @@ def _check_exists(
 
         return None
 
+    def _lookup_key(self, component_type: ComponentTypes, config: dict) -> tuple:
+        """Key identifying a component by its configured uniqueness fields."""
+        fields = self.uniqueness_fields.get(component_type, [])
+        return (component_type, *(config.get(field) for field in fields))
+
+    def _check_exists_cached(
+        self, component_type: ComponentTypes, config: dict, user_id: str, lookup_cache: dict
+    ) -> Optional[Union[Model, Tool, Agent, Team]]:
+        """Check if component exists, memoizing results for components shared within a single import."""
+        key = self._lookup_key(component_type, config)
+        if key not in lookup_cache:
+            lookup_cache[key] = self._check_exists(component_type, config, user_id)
+        return lookup_cache[key]
+
+    def _remember(
+        self, lookup_cache: dict, component_type: ComponentTypes, config: dict, component: Union[Model, Tool, Agent]
+    ) -> None:
+        """Record a newly stored component so later lookups in the same import find it."""
+        lookup_cache[self._lookup_key(component_type, config)] = component
+
     def _format_exists_message(self, component_type: ComponentTypes, config: dict) -> str:
         """Format existence message with identifying fields."""
         fields = self.uniqueness_fields.get(component_type, [])
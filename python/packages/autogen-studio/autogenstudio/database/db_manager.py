@@ -1,13 +1,14 @@
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Type
 
 from loguru import logger
-from sqlalchemy import exc, func, inspect, text
+from sqlalchemy import exc, func, insert, inspect, text
 from sqlmodel import Session, SQLModel, and_, create_engine, select
 
-from ..datamodel import LinkTypes, Response
+from ..datamodel import LinkTypes, Message, Response, Run
+from ..datamodel import Session as SessionModel
 from .schema_manager import SchemaManager
 
 # from .dbutils import init_db_samples
@@ -90,17 +91,20 @@ def reset_db(self, recreate_tables: bool = True):
             self.engine.dispose()
             with Session(self.engine) as session:
                 try:
+                    # Run every statement on the session's connection so the PRAGMA applies to the drop
+                    connection = session.connection()
+
                     # Disable foreign key checks for SQLite
                     if "sqlite" in str(self.engine.url):
-                        session.exec(text("PRAGMA foreign_keys=OFF"))
+                        connection.execute(text("PRAGMA foreign_keys=OFF"))
 
                     # Drop all tables
-                    SQLModel.metadata.drop_all(self.engine)
+                    SQLModel.metadata.drop_all(connection)
                     logger.info("All tables dropped successfully")
 
                     # Re-enable foreign key checks for SQLite
                     if "sqlite" in str(self.engine.url):
-                        session.exec(text("PRAGMA foreign_keys=ON"))
+                        connection.execute(text("PRAGMA foreign_keys=ON"))
 
                     session.commit()
 
@@ -147,13 +151,14 @@ def upsert(self, model: SQLModel, return_json: bool = True):
 
         with Session(self.engine) as session:
             try:
-                existing_model = session.exec(select(model_class).where(model_class.id == model.id)).first()
+                # Primary key lookup; new rows without an id cannot exist yet
+                existing_model = session.get(model_class, model.id) if model.id is not None else None
                 if existing_model:
+                    # existing_model is already attached to the session, so updating it is enough
                     model.updated_at = datetime.now()
                     for key, value in model.model_dump().items():
                         setattr(existing_model, key, value)
                     model = existing_model  # Use the updated existing model
-                    session.add(model)
                 else:
                     session.add(model)
                 session.commit()
@@ -173,6 +178,52 @@ def upsert(self, model: SQLModel, return_json: bool = True):
             data=model.model_dump() if return_json else model,
         )
 
+    def add_all(
+        self,
+        models: List[SQLModel],
+        links: Optional[List[Tuple[LinkTypes, SQLModel, List[SQLModel]]]] = None,
+        return_json: bool = True,
+    ):
+        """Create multiple entities, and optionally the links between them, in a single transaction
+
+        Args:
+            models (List[SQLModel]): The new model instances to create
+            links (List[Tuple[LinkTypes, SQLModel, List[SQLModel]]], optional): (link_type, primary, secondaries)
+                entries. Entities may be new or existing; secondaries are appended in order after any existing
+                links of the primary. Links are inserted with one statement per link table. Nothing is written
+                if any step fails.
+            return_json (bool, optional): If True, returns the models as dictionaries.
+                If False, returns the SQLModel instances. Defaults to True.
+
+        Returns:
+            Response: Contains status, message and data (list of dicts or SQLModels, in input order)
+        """
+        status = True
+        status_message = "Entities Created Successfully"
+
+        # Keep attributes loaded after commit so primary keys can be read without a refresh per row
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                if links:
+                    # Assign primary keys to the new entities before building link rows
+                    session.flush()
+                    for link_table, rows in self._new_link_rows(session, links, models).items():
+                        if rows:
+                            session.execute(insert(link_table), rows)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error("Error while creating entities: " + str(e))
+                status = False
+                status_message = f"Error while creating entities: {e}"
+
+        return Response(
+            message=status_message,
+            status=status,
+            data=[model.model_dump() if return_json else model for model in models] if status else None,
+        )
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
@@ -182,8 +233,12 @@ def get(
         filters: dict = None,
         return_json: bool = False,
         order: str = "desc",
+        config_filters: dict = None,
     ):
-        """List entities"""
+        """List entities. List, tuple or set filter values are matched with IN.
+
+        config_filters matches string (or None) values of top-level keys in the JSON config column.
+        """
         with Session(self.engine) as session:
             result = []
             status = True
@@ -192,7 +247,20 @@ def get(
             try:
                 statement = select(model_class)
                 if filters:
-                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
+                    conditions = [
+                        getattr(model_class, col).in_(value)
+                        if isinstance(value, (list, tuple, set))
+                        else getattr(model_class, col) == value
+                        for col, value in filters.items()
+                    ]
+                    statement = statement.where(and_(*conditions))
+                if config_filters:
+                    conditions = [
+                        model_class.config[key].as_string().is_(None)
+                        if value is None
+                        else model_class.config[key].as_string() == value
+                        for key, value in config_filters.items()
+                    ]
                     statement = statement.where(and_(*conditions))
 
                 if hasattr(model_class, "created_at") and order:
@@ -210,6 +278,47 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    def get_session_runs(self, session_id: int, user_id: str):
+        """Get the runs of a user's session with their messages, both ordered by creation time.
+
+        Returns:
+            Response: data is None if the session does not exist or belongs to another user,
+                otherwise a list of (run, messages) tuples. Runs keep empty messages if fetching them fails.
+        """
+        with Session(self.engine) as session:
+            try:
+                # Verify ownership and list runs in one query; the outer join keeps sessions without runs
+                rows = session.exec(
+                    select(SessionModel.id, Run)
+                    .outerjoin(Run, Run.session_id == SessionModel.id)
+                    .where(and_(SessionModel.id == session_id, SessionModel.user_id == user_id))
+                    .order_by(Run.created_at.asc())
+                ).all()
+                if not rows:
+                    return Response(message="Session not found", status=True, data=None)
+
+                runs = [run for _, run in rows if run is not None]
+
+                # Fetch messages for all runs at once and group them by run
+                messages_by_run = {run.id: [] for run in runs}
+                if runs:
+                    messages = self.get(Message, {"run_id": list(messages_by_run)}, order="asc")
+                    if not messages.status:
+                        # Keep returning the runs, with empty messages, rather than failing the whole history
+                        logger.error(f"Error getting messages for runs of session {session_id}: {messages.message}")
+                    for message in messages.data:
+                        messages_by_run[message.run_id].append(message)
+
+                return Response(
+                    message="Session runs retrieved successfully",
+                    status=True,
+                    data=[(run, messages_by_run[run.id]) for run in runs],
+                )
+
+            except Exception as e:
+                logger.error(f"Error getting session runs: {str(e)}")
+                return Response(message=f"Error getting session runs: {str(e)}", status=False, data=None)
+
     def delete(self, model_class: SQLModel, filters: dict = None):
         """Delete an entity"""
         status_message = ""
@@ -306,6 +415,54 @@ def link(
                 session.rollback()
                 return Response(message=f"Error linking entities: {str(e)}", status=False)
 
+    def _new_link_rows(
+        self,
+        session: Session,
+        links: List[Tuple[LinkTypes, SQLModel, List[SQLModel]]],
+        new_models: List[SQLModel],
+    ) -> Dict[Type[SQLModel], List[dict]]:
+        """Build link rows grouped by link table, skipping existing links and sequencing after them.
+
+        Primaries created in the same call cannot have links yet, so only stored primaries are looked up.
+        """
+        new_primaries = {id(model) for model in new_models}
+        link_state = {}  # (link_type, primary id) -> (linked secondary ids, next sequence)
+        rows_by_table = {}
+
+        for link_type, primary, secondaries in links:
+            link_table = link_type.link_table
+
+            # Get field names
+            primary_id_field = f"{link_type.primary_class.__name__.lower()}_id"
+            secondary_id_field = f"{link_type.secondary_class.__name__.lower()}_id"
+
+            key = (link_type, primary.id)
+            if key not in link_state:
+                if id(primary) in new_primaries:
+                    link_state[key] = (set(), 0)
+                else:
+                    # Existing links and the next sequence number in one query
+                    existing = session.exec(
+                        select(getattr(link_table, secondary_id_field), link_table.sequence).where(
+                            getattr(link_table, primary_id_field) == primary.id
+                        )
+                    ).all()
+                    sequences = [sequence for _, sequence in existing if sequence is not None]
+                    link_state[key] = ({secondary_id for secondary_id, _ in existing}, max(sequences, default=-1) + 1)
+            linked_ids, sequence = link_state[key]
+
+            # Create new links
+            rows = rows_by_table.setdefault(link_table, [])
+            for secondary in secondaries:
+                if secondary.id in linked_ids:
+                    continue
+                linked_ids.add(secondary.id)
+                rows.append({primary_id_field: primary.id, secondary_id_field: secondary.id, "sequence": sequence})
+                sequence += 1
+            link_state[key] = (linked_ids, sequence)
+
+        return rows_by_table
+
     def unlink(self, link_type: LinkTypes, primary_id: int, secondary_id: int, sequence: Optional[int] = None):
         """Unlink two entities and reorder sequences if needed."""
         with Session(self.engine) as session:
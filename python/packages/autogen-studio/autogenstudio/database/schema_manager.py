@@ -1,7 +1,10 @@
+import io
 import os
 import shutil
+import sys
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import sqlmodel
 from alembic import command
@@ -49,15 +52,13 @@ def initialize_migrations(self, force: bool = False) -> bool:
                 self._cleanup_existing_alembic()
                 if not self._initialize_alembic():
                     return False
+            elif self._is_alembic_configured():
+                logger.info("Using existing Alembic configuration")
+                self._update_configuration()
             else:
-                try:
-                    self._validate_alembic_setup()
-                    logger.info("Using existing Alembic configuration")
-                    self._update_configuration()
-                except FileNotFoundError:
-                    logger.info("Initializing new Alembic configuration")
-                    if not self._initialize_alembic():
-                        return False
+                logger.info("Initializing new Alembic configuration")
+                if not self._initialize_alembic():
+                    return False
 
             # Only generate initial revision if alembic is properly initialized
             logger.info("Creating initial migration...")
@@ -102,27 +103,6 @@ def _cleanup_existing_alembic(self) -> None:
             self.alembic_ini_path.unlink()
             logger.info("Removed alembic.ini")
 
-    def _ensure_alembic_setup(self, *, force: bool = False) -> None:
-        """
-        Ensures Alembic is properly set up, initializing if necessary.
-
-        Args:
-            force: If True, removes existing configuration and reinitializes
-        """
-        try:
-            self._validate_alembic_setup()
-            if force:
-                logger.info("Force initialization requested. Cleaning up existing configuration...")
-                self._cleanup_existing_alembic()
-                self._initialize_alembic()
-        except FileNotFoundError:
-            logger.info("Alembic configuration not found. Initializing...")
-            if self.alembic_dir.exists():
-                logger.warning("Found existing alembic directory but missing configuration")
-                self._cleanup_existing_alembic()
-            self._initialize_alembic()
-            logger.info("Alembic initialization complete")
-
     def _initialize_alembic(self) -> bool:
         """Initialize alembic structure and configuration"""
         try:
@@ -138,8 +118,9 @@ def _initialize_alembic(self) -> bool:
                 f.write(config_content)
 
             # Use the config we just created
-            config = Config(str(self.alembic_ini_path))
-            command.init(config, str(self.alembic_dir))
+            with self._capture_alembic_output():
+                config = self.get_alembic_config()
+                command.init(config, str(self.alembic_dir))
 
             # Update script template after initialization
             self.update_script_template()
@@ -335,13 +316,12 @@ def _ensure_alembic_setup(self, *, force: bool = False) -> None:
         Args:
             force: If True, removes existing configuration and reinitializes
         """
-        try:
-            self._validate_alembic_setup()
+        if self._is_alembic_configured():
             if force:
                 logger.info("Force initialization requested. Cleaning up existing configuration...")
                 self._cleanup_existing_alembic()
                 self._initialize_alembic()
-        except FileNotFoundError:
+        else:
             logger.info("Alembic configuration not found. Initializing...")
             if self.alembic_dir.exists():
                 logger.warning("Found existing alembic directory but missing configuration")
@@ -349,13 +329,10 @@ def _ensure_alembic_setup(self, *, force: bool = False) -> None:
             self._initialize_alembic()
             logger.info("Alembic initialization complete")
 
-    def _validate_alembic_setup(self) -> None:
-        """Validates that Alembic is properly configured."""
+    def _is_alembic_configured(self) -> bool:
+        """Checks whether Alembic is properly configured, without raising."""
         required_files = [self.alembic_ini_path, self.alembic_dir / "env.py", self.alembic_dir / "versions"]
-
-        missing = [f for f in required_files if not f.exists()]
-        if missing:
-            raise FileNotFoundError(f"Alembic configuration incomplete. Missing: {', '.join(str(f) for f in missing)}")
+        return all(f.exists() for f in required_files)
 
     def get_alembic_config(self) -> Config:
         """
@@ -370,7 +347,20 @@ def get_alembic_config(self) -> Config:
         if not self.alembic_ini_path.exists():
             raise FileNotFoundError("Could not find alembic.ini")
 
-        return Config(str(self.alembic_ini_path))
+        # Bind stdout at call time so output follows any active _capture_alembic_output
+        return Config(str(self.alembic_ini_path), stdout=sys.stdout)
+
+    @contextmanager
+    def _capture_alembic_output(self) -> Iterator[None]:
+        """Capture Alembic console output and forward it to the debug log in a single write."""
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                yield
+        finally:
+            output = buffer.getvalue().strip()
+            if output:
+                logger.debug(output)
 
     def get_current_revision(self) -> Optional[str]:
         """
@@ -414,13 +404,18 @@ def check_schema_status(self) -> Tuple[bool, str]:
             Tuple[bool, str]: (needs_upgrade, status_message)
         """
         try:
-            current_rev = self.get_current_revision()
             head_rev = self.get_head_revision()
 
-            if current_rev != head_rev:
-                return True, f"Database needs upgrade: {current_rev} -> {head_rev}"
+            # Read the revision and compare metadata over a single connection
+            with self.engine.connect() as conn:
+                context = MigrationContext.configure(conn)
+                current_rev = context.get_current_revision()
+
+                if current_rev != head_rev:
+                    return True, f"Database needs upgrade: {current_rev} -> {head_rev}"
+
+                differences = list(compare_metadata(context, SQLModel.metadata))
 
-            differences = self.get_schema_differences()
             if differences:
                 changes_desc = "\n".join(str(diff) for diff in differences)
                 return True, f"Unmigrated changes detected:\n{changes_desc}"
@@ -442,8 +437,9 @@ def upgrade_schema(self, revision: str = "head") -> bool:
             bool: True if upgrade successful
         """
         try:
-            config = self.get_alembic_config()
-            command.upgrade(config, revision)
+            with self._capture_alembic_output():
+                config = self.get_alembic_config()
+                command.upgrade(config, revision)
             logger.info(f"Schema upgraded successfully to {revision}")
             return True
 
@@ -480,8 +476,9 @@ def generate_revision(self, message: str = "auto") -> Optional[str]:
             str: Revision ID if successful, None otherwise
         """
         try:
-            config = self.get_alembic_config()
-            command.revision(config, message=message, autogenerate=True)
+            with self._capture_alembic_output():
+                config = self.get_alembic_config()
+                command.revision(config, message=message, autogenerate=True)
             return self.get_head_revision()
 
         except Exception as e:
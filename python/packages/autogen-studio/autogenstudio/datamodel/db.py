@@ -7,7 +7,7 @@
 
 from loguru import logger
 from pydantic import BaseModel
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
 from sqlmodel import JSON, Column, DateTime, Field, Relationship, SQLModel, func
 
 from .types import AgentConfig, MessageConfig, MessageMeta, ModelConfig, TeamConfig, TeamResult, ToolConfig
@@ -176,7 +176,10 @@ class Agent(SQLModel, table=True):
 
 
 class Message(SQLModel, table=True):
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        Index("ix_message_run_id_created_at", "run_id", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(
         default_factory=datetime.now,
@@ -224,7 +227,10 @@ class RunStatus(str, Enum):
 class Run(SQLModel, table=True):
     """Represents a single execution run within a session"""
 
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        Index("ix_run_session_id_created_at", "session_id", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     created_at: datetime = Field(
@@ -4,6 +4,7 @@
 import re
 import shutil
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
@@ -41,6 +42,65 @@ def str_to_datetime(dt_str: str) -> datetime:
     return datetime.fromisoformat(dt_str)
 
 
+# Extended list of file extensions for code and text files
+CODE_EXTENSIONS = {
+    ".py",
+    ".js",
+    ".jsx",
+    ".java",
+    ".c",
+    ".cpp",
+    ".cs",
+    ".ts",
+    ".tsx",
+    ".html",
+    ".css",
+    ".scss",
+    ".less",
+    ".json",
+    ".xml",
+    ".yaml",
+    ".yml",
+    ".md",
+    ".rst",
+    ".tex",
+    ".sh",
+    ".bat",
+    ".ps1",
+    ".php",
+    ".rb",
+    ".go",
+    ".swift",
+    ".kt",
+    ".hs",
+    ".scala",
+    ".lua",
+    ".pl",
+    ".sql",
+    ".config",
+}
+
+# Supported spreadsheet extensions
+CSV_EXTENSIONS = {".csv", ".xlsx"}
+
+# Supported image extensions
+IMAGE_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".bmp",
+    ".tiff",
+    ".svg",
+    ".webp",
+}
+# Supported (web) video extensions
+VIDEO_EXTENSIONS = {".mp4", ".webm", ".ogg", ".mov", ".avi", ".wmv"}
+
+# Supported PDF extension
+PDF_EXTENSION = ".pdf"
+
+
 def get_file_type(file_path: str) -> str:
     """
 
@@ -52,64 +112,6 @@ def get_file_type(file_path: str) -> str:
     :return: A  string containing the file type.
     """
 
-    # Extended list of file extensions for code and text files
-    CODE_EXTENSIONS = {
-        ".py",
-        ".js",
-        ".jsx",
-        ".java",
-        ".c",
-        ".cpp",
-        ".cs",
-        ".ts",
-        ".tsx",
-        ".html",
-        ".css",
-        ".scss",
-        ".less",
-        ".json",
-        ".xml",
-        ".yaml",
-        ".yml",
-        ".md",
-        ".rst",
-        ".tex",
-        ".sh",
-        ".bat",
-        ".ps1",
-        ".php",
-        ".rb",
-        ".go",
-        ".swift",
-        ".kt",
-        ".hs",
-        ".scala",
-        ".lua",
-        ".pl",
-        ".sql",
-        ".config",
-    }
-
-    # Supported spreadsheet extensions
-    CSV_EXTENSIONS = {".csv", ".xlsx"}
-
-    # Supported image extensions
-    IMAGE_EXTENSIONS = {
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".bmp",
-        ".tiff",
-        ".svg",
-        ".webp",
-    }
-    # Supported (web) video extensions
-    VIDEO_EXTENSIONS = {".mp4", ".webm", ".ogg", ".mov", ".avi", ".wmv"}
-
-    # Supported PDF extension
-    PDF_EXTENSION = ".pdf"
-
     # Determine the file extension
     _, file_extension = os.path.splitext(file_path)
 
@@ -175,7 +177,7 @@ def get_modified_files(start_timestamp: float, end_timestamp: float, source_dir:
                 modified_files.append(file_dict)
 
     # Sort the modified files by extension
-    modified_files.sort(key=lambda x: x["extension"])
+    modified_files.sort(key=itemgetter("extension"))
     return modified_files
 
 
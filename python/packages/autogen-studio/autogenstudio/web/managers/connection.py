@@ -91,16 +91,17 @@ async def start_stream(self, run_id: UUID, task: str, team_config: dict) -> None
                 if formatted_message:
                     await self._send_message(run_id, formatted_message)
 
-                    # Save message if it's a content message
+                    # Save message if it's a content message, reusing the dump made for sending
                     if isinstance(message, TextMessage):
-                        await self._save_message(run_id, message)
+                        await self._save_message(run_id, message, formatted_message["data"])
                     elif isinstance(message, MultiModalMessage):
+                        # Formatted dump rewrites image content for display, so store the original
                         await self._save_message(run_id, message)
                     # Capture final result if it's a TeamResult
                     elif isinstance(message, TeamResult):
-                        final_result = message.model_dump()
+                        final_result = formatted_message["data"]
                     elif isinstance(message, (AgentMessage, ChatMessage)):
-                        await self._save_message(run_id, message)
+                        await self._save_message(run_id, message, formatted_message["data"])
             if not cancellation_token.is_cancelled() and run_id not in self._closed_connections:
                 if final_result:
                     await self._update_run(run_id, RunStatus.COMPLETE, team_result=final_result)
@@ -126,14 +127,22 @@ async def start_stream(self, run_id: UUID, task: str, team_config: dict) -> None
         finally:
             self._cancellation_tokens.pop(run_id, None)
 
-    async def _save_message(self, run_id: UUID, message: Union[AgentMessage, ChatMessage]) -> None:
-        """Save a message to the database"""
+    async def _save_message(
+        self, run_id: UUID, message: Union[AgentMessage, ChatMessage], message_dump: Optional[dict] = None
+    ) -> None:
+        """Save a message to the database
+
+        Args:
+            run_id: UUID of the run
+            message: Message to save
+            message_dump: Optional existing ``model_dump()`` of the message, to avoid serializing it again
+        """
         run = await self._get_run(run_id)
         if run:
             db_message = Message(
                 session_id=run.session_id,
                 run_id=run_id,
-                config=message.model_dump(),
+                config=message_dump if message_dump is not None else message.model_dump(),
                 user_id=None,  # You might want to pass this from somewhere
             )
             self.db_manager.upsert(db_message)
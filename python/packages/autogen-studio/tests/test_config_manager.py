@@ -0,0 +1,194 @@
+import os
+import asyncio
+import json
+import pytest
+from sqlmodel import Session, select
+from typing import Generator
+
+from autogenstudio.database import DatabaseManager, ConfigurationManager
+from autogenstudio.datamodel.types import (
+    ModelConfig, AgentConfig, ToolConfig,
+    TeamConfig, ModelTypes, AgentTypes, TeamTypes, ComponentTypes,
+    TerminationConfig, TerminationTypes, ToolTypes
+)
+from autogenstudio.datamodel.db import (
+    Model, Tool, Agent, Team, LinkTypes, AgentModelLink, AgentToolLink, TeamAgentLink
+)
+
+
+@pytest.fixture
+def test_db() -> Generator[DatabaseManager, None, None]:
+    """Fixture for test database"""
+    db_path = "test_config.db"
+    db = DatabaseManager(f"sqlite:///{db_path}")
+    db.reset_db()
+    db.initialize_database(auto_upgrade=False)
+    yield db
+    # Clean up
+    asyncio.run(db.close())
+    db.reset_db()
+    try:
+        if os.path.exists(db_path):
+            os.remove(db_path)
+    except Exception as e:
+        print(f"Warning: Failed to remove test database file: {e}")
+
+
+@pytest.fixture
+def config_manager(test_db: DatabaseManager) -> ConfigurationManager:
+    return ConfigurationManager(test_db)
+
+
+@pytest.fixture
+def test_user() -> str:
+    return "test_user@example.com"
+
+
+@pytest.fixture
+def sample_team_config() -> TeamConfig:
+    """Team whose two agents share the same model client and tool"""
+    model_config = ModelConfig(
+        model="gpt-4",
+        model_type=ModelTypes.OPENAI,
+        component_type=ComponentTypes.MODEL,
+        version="1.0.0"
+    )
+    tool_config = ToolConfig(
+        name="test_tool",
+        description="A test tool",
+        content="async def test_func(x: str) -> str:\n    return f'Test {x}'",
+        tool_type=ToolTypes.PYTHON_FUNCTION,
+        component_type=ComponentTypes.TOOL,
+        version="1.0.0"
+    )
+    return TeamConfig(
+        name="test_team",
+        participants=[
+            AgentConfig(
+                name=name,
+                agent_type=AgentTypes.ASSISTANT,
+                model_client=model_config,
+                tools=[tool_config],
+                component_type=ComponentTypes.AGENT,
+                version="1.0.0"
+            )
+            for name in ["first_agent", "second_agent"]
+        ],
+        termination_condition=TerminationConfig(
+            termination_type=TerminationTypes.STOP_MESSAGE,
+            component_type=ComponentTypes.TERMINATION,
+            version="1.0.0"
+        ),
+        team_type=TeamTypes.ROUND_ROBIN,
+        component_type=ComponentTypes.TEAM,
+        version="1.0.0"
+    )
+
+
+def count_rows(db: DatabaseManager) -> dict:
+    """Count the rows of every table a team import writes to"""
+    with Session(db.engine) as session:
+        return {
+            table.__name__: len(session.exec(select(table)).all())
+            for table in (Team, Agent, Model, Tool, TeamAgentLink, AgentModelLink, AgentToolLink)
+        }
+
+
+class TestConfigurationManager:
+    @pytest.mark.asyncio
+    async def test_import_team_rolls_back_on_failure(self, test_db: DatabaseManager,
+                                                     config_manager: ConfigurationManager,
+                                                     sample_team_config: TeamConfig, test_user: str,
+                                                     monkeypatch: pytest.MonkeyPatch):
+        """Test that a team import failing partway leaves no rows behind"""
+        new_link_rows = DatabaseManager._new_link_rows
+
+        def failing_new_link_rows(self, session, links, new_models):
+            # Duplicate a tool link so its insert fails after the entities and model links are written
+            rows_by_table = new_link_rows(self, session, links, new_models)
+            rows_by_table[AgentToolLink].append(rows_by_table[AgentToolLink][0])
+            return rows_by_table
+
+        monkeypatch.setattr(DatabaseManager, "_new_link_rows", failing_new_link_rows)
+
+        response = await config_manager.import_component(sample_team_config, test_user, check_exists=True)
+        assert response.status is False
+        assert all(count == 0 for count in count_rows(test_db).values())
+
+    @pytest.mark.asyncio
+    async def test_import_directory_is_idempotent(self, test_db: DatabaseManager,
+                                                  config_manager: ConfigurationManager,
+                                                  sample_team_config: TeamConfig, test_user: str, tmp_path):
+        """Test that re-importing a directory with check_exists creates nothing new"""
+        (tmp_path / "team.json").write_text(json.dumps(sample_team_config.model_dump(mode="json")))
+
+        response = await config_manager.import_directory(tmp_path, test_user, check_exists=True)
+        assert response.status is True
+        assert [result["status"] for result in response.data] == [True]
+        first_counts = count_rows(test_db)
+        assert first_counts["Team"] == 1
+        assert first_counts["Agent"] == 2
+
+        response = await config_manager.import_directory(tmp_path, test_user, check_exists=True)
+        assert response.status is True
+        assert "already exists" in response.data[0]["message"]
+        assert response.data[0]["id"] == test_db.get(Team).data[0].id
+        assert count_rows(test_db) == first_counts
+
+    @pytest.mark.asyncio
+    async def test_import_team_reuses_shared_components(self, test_db: DatabaseManager,
+                                                        config_manager: ConfigurationManager,
+                                                        sample_team_config: TeamConfig, test_user: str):
+        """Test that a model and tool shared by two agents are stored once and linked to both"""
+        response = await config_manager.import_component(sample_team_config, test_user, check_exists=True)
+        assert response.status is True
+
+        counts = count_rows(test_db)
+        assert counts["Agent"] == 2
+        assert counts["Model"] == 1
+        assert counts["Tool"] == 1
+        assert counts["AgentModelLink"] == 2
+        assert counts["AgentToolLink"] == 2
+
+        model_id = test_db.get(Model).data[0].id
+        tool_id = test_db.get(Tool).data[0].id
+        for agent in test_db.get(Agent).data:
+            assert [m.id for m in test_db.get_linked_entities(LinkTypes.AGENT_MODEL, agent.id).data] == [model_id]
+            assert [t.id for t in test_db.get_linked_entities(LinkTypes.AGENT_TOOL, agent.id).data] == [tool_id]
+
+    @pytest.mark.asyncio
+    async def test_import_teams_sharing_an_agent(self, test_db: DatabaseManager,
+                                                 config_manager: ConfigurationManager,
+                                                 sample_team_config: TeamConfig, test_user: str):
+        """Test that two teams with the same participants are both stored with their own agents"""
+        second_team_config = sample_team_config.model_copy(update={"name": "second_team"})
+        for team_config in (sample_team_config, second_team_config):
+            response = await config_manager.import_component(team_config, test_user, check_exists=True)
+            assert response.status is True
+
+        counts = count_rows(test_db)
+        assert counts["Team"] == 2
+        assert counts["Agent"] == 4
+        assert counts["TeamAgentLink"] == 4
+        assert counts["Model"] == 1
+        assert counts["Tool"] == 1
+
+        for team in test_db.get(Team).data:
+            linked_agents = test_db.get_linked_entities(LinkTypes.TEAM_AGENT, team.id).data
+            assert [agent.config["name"] for agent in linked_agents] == ["first_agent", "second_agent"]
+
+    @pytest.mark.asyncio
+    async def test_import_agent_with_repeated_tool(self, test_db: DatabaseManager,
+                                                   config_manager: ConfigurationManager,
+                                                   sample_team_config: TeamConfig, test_user: str):
+        """Test that a tool listed twice by one agent is stored and linked once"""
+        agent_config = sample_team_config.participants[0]
+        agent_config = agent_config.model_copy(update={"tools": agent_config.tools * 2})
+
+        response = await config_manager.import_component(agent_config, test_user, check_exists=True)
+        assert response.status is True
+
+        counts = count_rows(test_db)
+        assert counts["Agent"] == 1
+        assert counts["Tool"] == 1
+        assert counts["AgentToolLink"] == 1
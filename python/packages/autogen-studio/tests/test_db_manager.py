@@ -1,6 +1,8 @@
 import os
 import asyncio
+from datetime import datetime, timedelta
 import pytest
+from sqlalchemy import event
 from sqlmodel import Session, text, select
 from typing import Generator
 
@@ -8,9 +10,10 @@
 from autogenstudio.datamodel.types import (
     ModelConfig, AgentConfig, ToolConfig,
     TeamConfig, ModelTypes, AgentTypes, TeamTypes, ComponentTypes,
-    TerminationConfig, TerminationTypes,  ToolTypes
+    TerminationConfig, TerminationTypes,  ToolTypes, Response
 )
-from autogenstudio.datamodel.db import Model, Tool, Agent, Team, LinkTypes
+from autogenstudio.datamodel.db import Model, Tool, Agent, Team, LinkTypes, Message, Run
+from autogenstudio.datamodel.db import Session as SessionModel
 
 
 @pytest.fixture
@@ -183,6 +186,110 @@ def test_multiple_links(self, test_db: DatabaseManager, sample_agent: Agent):
         assert "gpt-4" in model_names
         assert "gpt-3.5" in model_names
 
+    def test_add_all_links_existing_entities(self, test_db: DatabaseManager, sample_agent: Agent,
+                                             sample_tool: Tool):
+        """Test linking stored entities through add_all, appending after existing links"""
+        tools = [sample_tool] + [
+            Tool(user_id="test_user", config={**sample_tool.config, "name": f"test_tool_{i}"}) for i in range(2)
+        ]
+        test_db.add_all([sample_agent, *tools])
+        tool_ids = [tool.id for tool in tools]
+
+        # Existing links are skipped and new ones are appended in order
+        test_db.link(LinkTypes.AGENT_TOOL, sample_agent.id, tool_ids[1])
+        response = test_db.add_all([], links=[(LinkTypes.AGENT_TOOL, sample_agent, tools)])
+        assert response.status is True
+
+        linked_tools = test_db.get_linked_entities(LinkTypes.AGENT_TOOL, sample_agent.id)
+        assert [tool.id for tool in linked_tools.data] == [tool_ids[1], tool_ids[0], tool_ids[2]]
+
+    def test_add_all_with_links(self, test_db: DatabaseManager, sample_model: Model, sample_tool: Tool,
+                                sample_agent: Agent, sample_team: Team):
+        """Test creating entities and their links atomically"""
+        response = test_db.add_all(
+            [sample_team, sample_agent, sample_model, sample_tool],
+            links=[
+                (LinkTypes.TEAM_AGENT, sample_team, [sample_agent]),
+                (LinkTypes.AGENT_MODEL, sample_agent, [sample_model]),
+                (LinkTypes.AGENT_TOOL, sample_agent, [sample_tool]),
+            ],
+        )
+        assert response.status is True
+        assert [a.id for a in test_db.get_linked_entities(LinkTypes.TEAM_AGENT, sample_team.id).data] == [sample_agent.id]
+        assert [m.id for m in test_db.get_linked_entities(LinkTypes.AGENT_MODEL, sample_agent.id).data] == [sample_model.id]
+        assert [t.id for t in test_db.get_linked_entities(LinkTypes.AGENT_TOOL, sample_agent.id).data] == [sample_tool.id]
+
+        # A failing insert rolls back every entity and link in the call
+        new_agent = Agent(user_id="test_user", config=sample_agent.config)
+        duplicate_tool = Tool(id=sample_tool.id, user_id="test_user", config=sample_tool.config)
+        response = test_db.add_all(
+            [new_agent, duplicate_tool], links=[(LinkTypes.TEAM_AGENT, sample_team, [new_agent])]
+        )
+        assert response.status is False
+        assert len(test_db.get(Agent).data) == 1
+        assert len(test_db.get_linked_entities(LinkTypes.TEAM_AGENT, sample_team.id).data) == 1
+
+    def test_add_all_batches_link_inserts(self, test_db: DatabaseManager, sample_model: Model, sample_tool: Tool,
+                                          sample_agent: Agent, sample_team: Team):
+        """Test that links of new entities are written with one INSERT per link table and no lookups"""
+        agents = [sample_agent] + [Agent(user_id="test_user", config=sample_agent.config) for _ in range(2)]
+        links = [(LinkTypes.TEAM_AGENT, sample_team, agents)]
+        for agent in agents:
+            links += [(LinkTypes.AGENT_MODEL, agent, [sample_model]), (LinkTypes.AGENT_TOOL, agent, [sample_tool])]
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_db.engine, "before_cursor_execute", record)
+        try:
+            response = test_db.add_all([sample_team, *agents, sample_model, sample_tool], links=links)
+        finally:
+            event.remove(test_db.engine, "before_cursor_execute", record)
+        assert response.status is True
+
+        link_statements = [statement for statement in statements if "link" in statement.lower()]
+        assert len(link_statements) == 3
+        assert all(statement.startswith("INSERT") for statement in link_statements)
+        assert len(test_db.get_linked_entities(LinkTypes.TEAM_AGENT, sample_team.id).data) == 3
+        for agent in agents:
+            assert len(test_db.get_linked_entities(LinkTypes.AGENT_TOOL, agent.id).data) == 1
+
+    def test_get_session_runs(self, test_db: DatabaseManager, test_user: str, monkeypatch: pytest.MonkeyPatch):
+        """Test loading a session's runs with their messages"""
+        chat_session = SessionModel(user_id=test_user, name="test_session")
+        empty_session = SessionModel(user_id=test_user, name="empty_session")
+        test_db.add_all([chat_session, empty_session])
+        start = datetime(2024, 1, 1)
+        runs = [
+            Run(session_id=chat_session.id, task=None, team_result=None, created_at=start + timedelta(minutes=i))
+            for i in range(2)
+        ]
+        test_db.add_all(runs)
+        test_db.add_all([
+            Message(session_id=chat_session.id, run_id=runs[0].id, created_at=start + timedelta(seconds=i),
+                    config={"source": source, "content": content})
+            for i, (source, content) in enumerate([("user", "hi"), ("agent", "hello")])
+        ])
+
+        result = test_db.get_session_runs(chat_session.id, test_user)
+        assert result.status is True
+        assert [run.id for run, _ in result.data] == [run.id for run in runs]
+        assert [message.config["content"] for message in result.data[0][1]] == ["hi", "hello"]
+        assert result.data[1][1] == []
+
+        # Sessions without runs return an empty list, unknown or foreign sessions return None
+        assert test_db.get_session_runs(empty_session.id, test_user).data == []
+        assert test_db.get_session_runs(chat_session.id, "other_user").data is None
+        assert test_db.get_session_runs(999999, test_user).data is None
+
+        # A failed message fetch still returns the runs, with empty messages
+        monkeypatch.setattr(test_db, "get", lambda *args, **kwargs: Response(message="failed", status=False, data=[]))
+        result = test_db.get_session_runs(chat_session.id, test_user)
+        assert result.status is True
+        assert [(run.id, messages) for run, messages in result.data] == [(run.id, []) for run in runs]
+
     def test_upsert_operations(self, test_db: DatabaseManager, sample_model: Model):
         """Test upsert for both create and update scenarios"""
         # Test Create
@@ -201,6 +308,62 @@ def test_upsert_operations(self, test_db: DatabaseManager, sample_model: Model):
         assert result.status is True
         assert result.data[0].config["model"] == "gpt-4-turbo"
 
+    def test_get_with_list_filter(self, test_db: DatabaseManager, test_user: str):
+        """Test that list filter values are matched with IN"""
+        models = [
+            Model(
+                user_id=test_user,
+                config=ModelConfig(
+                    model=name,
+                    model_type=ModelTypes.OPENAI,
+                    component_type=ComponentTypes.MODEL,
+                    version="1.0.0"
+                ).model_dump()
+            )
+            for name in ["gpt-4", "gpt-3.5", "gpt-4o"]
+        ]
+        for model in models:
+            test_db.upsert(model)
+
+        result = test_db.get(Model, {"id": [models[0].id, models[2].id]})
+        assert result.status is True
+        assert sorted(model.id for model in result.data) == sorted([models[0].id, models[2].id])
+
+        # Empty list matches nothing
+        result = test_db.get(Model, {"id": []})
+        assert result.status is True
+        assert len(result.data) == 0
+
+    def test_get_with_config_filters(self, test_db: DatabaseManager, sample_model: Model, sample_tool: Tool):
+        """Test filtering on keys of the JSON config column"""
+        test_db.upsert(sample_model)
+        test_db.upsert(sample_tool)
+
+        result = test_db.get(Model, config_filters={"model": "gpt-4", "model_type": ModelTypes.OPENAI.value})
+        assert result.status is True
+        assert [model.id for model in result.data] == [sample_model.id]
+
+        result = test_db.get(Model, config_filters={"model": "gpt-3.5"})
+        assert result.status is True
+        assert len(result.data) == 0
+
+        # Missing keys match None
+        result = test_db.get(Tool, config_filters={"name": "test_tool", "missing": None})
+        assert [tool.id for tool in result.data] == [sample_tool.id]
+
+    def test_add_all(self, test_db: DatabaseManager, sample_model: Model, sample_tool: Tool,
+                     sample_agent: Agent):
+        """Test creating multiple entities in one transaction"""
+        response = test_db.add_all([sample_agent, sample_model, sample_tool])
+        assert response.status is True
+        assert len(response.data) == 3
+        assert [item["id"] for item in response.data] == [sample_agent.id, sample_model.id, sample_tool.id]
+
+        with Session(test_db.engine) as session:
+            assert session.get(Agent, sample_agent.id) is not None
+            assert session.get(Model, sample_model.id) is not None
+            assert session.get(Tool, sample_tool.id) is not None
+
     def test_delete_operations(self, test_db: DatabaseManager, sample_model: Model):
         """Test delete with various filters"""
         # First insert the model